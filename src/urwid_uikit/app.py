@@ -8,6 +8,7 @@ from abc import abstractmethod, ABCMeta
 from argparse import Namespace
 from heapq import heapify
 from inspect import signature
+from sys import intern
 from urwid import (
     AttrMap,
     Columns,
@@ -20,15 +21,17 @@ from urwid import (
     Widget,
     set_encoding,
 )
-from threading import Thread, current_thread
+from threading import Lock, get_ident
 from time import time
 from typing import (
     Any,
     Callable,
+    Dict,
     Generic,
-    NoReturn,
+    Iterable,
     Optional,
     Sequence,
+    Tuple,
     TypeVar,
 )
 
@@ -45,6 +48,16 @@ TWidget = TypeVar("TWidget", bound="Widget")
 
 Event = Any
 
+#: Lock that guards the lazy construction of the event queues of applications
+_event_queue_lock = Lock()
+
+_HEADER_ATTR = intern("header")
+_FOOTER_ATTR = intern("footer")
+
+
+def _noop() -> None:
+    pass
+
 
 class Application(Generic[TWidget], metaclass=ABCMeta):
     """Base class for urwid-based applications."""
@@ -79,14 +92,33 @@ class Application(Generic[TWidget], metaclass=ABCMeta):
         ("menu focus", "black", "light cyan"),
     ]
 
+    # Attribute names are looked up in dicts during rendering; interned
+    # strings can be matched by identity
+    palette = [(intern(name), *rest) for name, *rest in palette]
+
     _REFRESH_EVENT = object()
     _WAKE_UP_EVENT = object()
 
+    __slots__ = (
+        "_auto_refresh",
+        "_auto_refresh_timer",
+        "_event_dispatch",
+        "_event_loop",
+        "_events",
+        "_menu_overlay",
+        "_my_tid",
+        "_quit_requested",
+        "frame",
+        "loop",
+    )
+
     _auto_refresh: float
     _auto_refresh_timer: Optional["CallbackHandle"]
-    _events: SelectableQueue[Event]
+    _event_dispatch: Dict[int, Callable[[], None]]
+    _events: Optional[SelectableQueue[Event]]
     _menu_overlay: Optional[MenuOverlay]
-    _my_thread: Optional[Thread]
+    _my_tid: Optional[int]
+    _quit_requested: bool
 
     frame: TWidget
     """The main widget of the application."""
@@ -99,12 +131,16 @@ class Application(Generic[TWidget], metaclass=ABCMeta):
         self._auto_refresh = 0
         self._auto_refresh_timer = None
         self._event_loop = None
-        self._events = SelectableQueue()
+        self._event_dispatch = {
+            id(self._REFRESH_EVENT): _noop,
+            id(self._WAKE_UP_EVENT): _noop,
+        }
+        self._events = None
         self._menu_overlay = None
-        self._my_thread = None
+        self._my_tid = None
+        self._quit_requested = False
         self.loop = None  # type: ignore
         self.frame = self.create_ui()
-        self._menu_overlay = MenuOverlay(self.frame)
         self.loop = self._create_loop()
 
         if encoding:
@@ -332,6 +368,23 @@ class Application(Generic[TWidget], metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    @property
+    def dialog_overlay(self) -> MenuOverlay:
+        """The overlay on top of the main widget of the application that shows
+        the main menu and the dialogs of the application. Use its
+        ``open_dialog()`` method to show a dialog.
+
+        The overlay is created and installed as the topmost widget of the
+        main loop when it is accessed for the first time, so applications that
+        never show a menu or a dialog do not pay for an extra level in the
+        widget tree.
+        """
+        if self._menu_overlay is None:
+            assert self.loop is not None, "main loop is not ready yet"
+            self._menu_overlay = MenuOverlay(self.frame)
+            self.loop.widget = self._menu_overlay
+        return self._menu_overlay
+
     def get_event_loop(self) -> Any:
         """Returns the event loop instance to register in the main loop.
         Default is a new SelectEventLoop instance. Guarantees that it
@@ -354,7 +407,7 @@ class Application(Generic[TWidget], metaclass=ABCMeta):
         before the screen is redrawn the next time. The ordering of events
         is preserved.
         """
-        self._events.put(event)
+        self._get_event_queue().put(event)
 
     def invoke_menu(self) -> bool:
         """Invokes the main menu of the application.
@@ -364,11 +417,9 @@ class Application(Generic[TWidget], metaclass=ABCMeta):
             named `on_menu_invoked()`, returns ``False`` as there is no main
             menu associated to the application.
         """
-        assert self._menu_overlay is not None, "menu overlay is not ready yet"
-
         items = self.on_menu_invoked()
         if items is not None:
-            self._menu_overlay.open_menu(items, title="Main menu")
+            self.dialog_overlay.open_menu(items, title="Main menu")
             return True
         else:
             return False
@@ -404,20 +455,33 @@ class Application(Generic[TWidget], metaclass=ABCMeta):
 
     def run(self) -> None:
         """Creates and runs the main loop of the console GUI."""
-        self._my_thread = current_thread()
+        self._my_tid = get_ident()
+        self._quit_requested = False
 
-        self.loop.watch_file(self._events.fd, self._event_callback)
+        events = self._get_event_queue()
+        self.loop.watch_file(events.fd, self._event_callback)
 
         self.configure_main_loop()
         try:
             self.loop.run()
         finally:
-            self.loop.remove_watch_file(self._events.fd)
+            self.loop.remove_watch_file(events.fd)
             self.cleanup_main_loop()
 
-    def quit(self) -> NoReturn:
-        """Quits the application."""
-        raise ExitMainLoop()
+    def quit(self) -> None:
+        """Quits the application.
+
+        When the application was started with ``run()``, the main loop is
+        not terminated immediately; events that were injected into the event
+        queue before the request are processed first, and the main loop exits
+        afterwards.
+        """
+        if self._my_tid is None:
+            # Event queue is not watched by the main loop so we cannot defer
+            raise ExitMainLoop()
+
+        self._quit_requested = True
+        self.inject_event(self._WAKE_UP_EVENT)
 
     def _create_loop(self) -> MainLoop:
         """Creates the main loop of the application. Not to be overridden;
@@ -425,34 +489,52 @@ class Application(Generic[TWidget], metaclass=ABCMeta):
         ``create_event_loop()`` instead.
         """
         return MainLoop(
-            self._menu_overlay,
+            self.frame,
             self.palette,
             event_loop=self.get_event_loop(),
             unhandled_input=self.on_input,
         )
 
+    def _get_event_queue(self) -> SelectableQueue[Event]:
+        """Returns the event queue of the application, creating it if needed.
+
+        The queue is created lazily so applications that are never run do not
+        allocate the file descriptors needed by the queue.
+        """
+        events = self._events
+        if events is None:
+            with _event_queue_lock:
+                if self._events is None:
+                    self._events = SelectableQueue()
+                events = self._events
+        return events
+
     def _event_callback(self) -> None:
         """Handler called by the main loop when some events were injected
         into the main loop via ``inject_event()``, before the next screen
         refresh.
         """
-        pending_events = self._events.get_all()
+        # Internal sentinel events are looked up by identity so arbitrary
+        # (possibly unhashable) user events can be dispatched as well
+        get_handler = self._event_dispatch.get
+        pending_events = self._get_event_queue().get_all()
         for event in pending_events:
-            if event is self._REFRESH_EVENT:
-                pass
-            elif event is self._WAKE_UP_EVENT:
-                pass
+            handler = get_handler(id(event))
+            if handler is not None:
+                handler()
             else:
                 self.process_event(event)
 
+        if self._quit_requested:
+            raise ExitMainLoop()
+
     def _wake_up(self) -> None:
         """Forces the application to wake up if the main loop is currently
         in the idle state. Useful when another thread scheduled a new alarm
         or added a new file descriptor to watch.
         """
-        if self._my_thread is None:
-            return
-        if current_thread() is not self._my_thread:
+        tid = self._my_tid
+        if tid is not None and get_ident() != tid:
             self.inject_event(self._WAKE_UP_EVENT)
 
 
@@ -471,6 +553,17 @@ class CallbackHandle:
         num_called (int): the number of times the callback was called
     """
 
+    __slots__ = (
+        "_app",
+        "_handle",
+        "_next_call_at",
+        "_num_called",
+        "args",
+        "callback",
+        "interval",
+        "kwds",
+    )
+
     _app: Application
     _num_called: int
 
@@ -497,12 +590,12 @@ class CallbackHandle:
         self.args = args
         self.kwds = kwds
 
-    def _call(self, loop: MainLoop, user_data: Any):
+    def _call(self, loop: MainLoop, user_data: Any, _heapify=heapify):
         """Calls the callback stored in the handle right now."""
         # Fix a bug in urwid.SelectEventLoop
         if hasattr(loop, "event_loop"):
             if hasattr(loop.event_loop, "_alarms"):
-                heapify(loop.event_loop._alarms)
+                _heapify(loop.event_loop._alarms)
 
         self._num_called += 1
         self._handle = None
@@ -557,7 +650,7 @@ class CallbackHandle:
         return self._num_called
 
     def reschedule(
-        self, after: Optional[float] = None, to: Optional[float] = None
+        self, after: Optional[float] = None, to: Optional[float] = None, *, _time=time
     ) -> bool:
         """Reschedules the callback to the current time plus the given
         number of seconds, or to a given timestamp.
@@ -581,7 +674,7 @@ class CallbackHandle:
 
         self.cancel()
 
-        now = time()
+        now = _time()
         if to is not None:
             after = to - now
 
@@ -622,29 +715,36 @@ class ApplicationFrame(Frame):
         footer_label (urwid.Text): the default label in the footer component
     """
 
+    _pack_options: Dict[Widget, Tuple[Any, ...]]
+    """Options tuples for tightly packed widgets, keyed by the container
+    that they were created for. Options tuples are immutable so they can be
+    shared between all the widgets that are added to the same container.
+    """
+
     def __init__(self, body: Optional[Widget] = None):
         """Constructor."""
+        self._pack_options = {}
         self.header_columns = self._construct_header()
         self.footer_columns = self._construct_footer()
 
         super().__init__(
             body or SolidFill(),
-            AttrMap(Padding(self.header_columns, left=1, right=1), "header"),
-            AttrMap(Padding(self.footer_columns, left=1, right=1), "footer"),
+            AttrMap(Padding(self.header_columns, left=1, right=1), _HEADER_ATTR),
+            AttrMap(Padding(self.footer_columns, left=1, right=1), _FOOTER_ATTR),
         )
 
     def _construct_header(self) -> Widget:
         """Constructs and returns the urwid component to place in the
         header of the application.
         """
-        self.header_label = Text(("header", ""), wrap="clip")
+        self.header_label = Text((_HEADER_ATTR, ""), wrap="clip")
         return Columns([self.header_label], dividechars=1)
 
     def _construct_footer(self) -> Widget:
         """Constructs and returns the urwid component to place in the
         footer of the application.
         """
-        self.footer_label = Text(("footer", ""), wrap="clip")
+        self.footer_label = Text((_FOOTER_ATTR, ""), wrap="clip")
         return Columns([self.footer_label], dividechars=1)
 
     def add_header_widget(
@@ -685,6 +785,38 @@ class ApplicationFrame(Frame):
         """
         self._add_widget_to(self.footer_columns, widget, options, index)
 
+    def add_header_widgets(
+        self,
+        widgets: Iterable[Tuple[Widget, ColumnOptions]],
+        index: Optional[int] = None,
+    ):
+        """Adds multiple widgets to the header in a single step, triggering
+        only a single layout update in the header.
+
+        Parameters:
+            widgets: the widgets to add, each paired with its options in the
+                same format as accepted by ``add_header_widget()``
+            index: the index where the first new widget will be added in the
+                header. ``None`` means the end of the header.
+        """
+        self._add_widgets_to(self.header_columns, widgets, index)
+
+    def add_footer_widgets(
+        self,
+        widgets: Iterable[Tuple[Widget, ColumnOptions]],
+        index: Optional[int] = None,
+    ):
+        """Adds multiple widgets to the footer in a single step, triggering
+        only a single layout update in the footer.
+
+        Parameters:
+            widgets: the widgets to add, each paired with its options in the
+                same format as accepted by ``add_footer_widget()``
+            index: the index where the first new widget will be added in the
+                footer. ``None`` means the end of the footer.
+        """
+        self._add_widgets_to(self.footer_columns, widgets, index)
+
     def _add_widget_to(
         self,
         parent: Widget,
@@ -692,25 +824,53 @@ class ApplicationFrame(Frame):
         options: ColumnOptions,
         index: Optional[int],
     ):
+        options = self._process_column_options(parent, options)
+        if index is None:
+            parent.contents.append((widget, options))
+        else:
+            parent.contents.insert(index, (widget, options))
+
+    def _add_widgets_to(
+        self,
+        parent: Widget,
+        widgets: Iterable[Tuple[Widget, ColumnOptions]],
+        index: Optional[int],
+    ):
+        items = [
+            (widget, self._process_column_options(parent, options))
+            for widget, options in widgets
+        ]
+        if not items:
+            return
+
+        # Slice assignment modifies the contents list in one step so urwid
+        # sends only a single modification notification
+        contents = parent.contents
+        if index is None:
+            index = len(contents)
+        contents[index:index] = items
+
+    def _process_column_options(
+        self, parent: Widget, options: ColumnOptions
+    ) -> Tuple[Any, ...]:
         if options is None:
-            options = parent.options("pack")
+            pack_options = self._pack_options.get(parent)
+            if pack_options is None:
+                pack_options = parent.options("pack")  # type: ignore
+                self._pack_options[parent] = pack_options
+            return pack_options
         elif isinstance(options, int):
-            options = parent.options("given", options)
+            return parent.options("given", options)  # type: ignore
         elif isinstance(options, float):
-            options = parent.options("weight", options)
+            return parent.options("weight", options)  # type: ignore
         elif isinstance(options, tuple):
-            pass
+            return options
         else:
             raise TypeError(
                 "expected None, int, float or tuple as "
                 "options, got: {0!r}".format(type(options))
             )
 
-        if index is None:
-            parent.contents.append((widget, options))
-        else:
-            parent.contents.insert(index, (widget, options))
-
     @property
     def status(self) -> TextOrMarkup:
         """Status message shown in the footer."""
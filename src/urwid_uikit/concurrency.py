@@ -6,9 +6,27 @@ import errno
 import logging
 import os
 import queue
-
-from threading import Condition, Event, Thread
-from typing import Callable, Generic, List, Optional, Tuple, TypeVar, Union
+import select
+
+from collections import deque
+from itertools import count
+from random import randrange
+from threading import Condition, Event, Lock, Thread
+from time import monotonic
+from typing import (
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 __all__ = (
     "AtomicCounter",
@@ -32,6 +50,7 @@ class AtomicCounter:
 
     _value: int
     _condition: Condition
+    _waiters: int
 
     def __init__(self, value: int = 0):
         """Constructor.
@@ -41,6 +60,42 @@ class AtomicCounter:
         """
         self._value = value
         self._condition = Condition()
+        self._waiters = 0
+
+    def add_and_get(self, delta: int = 1) -> int:
+        """Increases the value of the counter atomically with the given value
+        and returns the new value.
+
+        Parameters:
+            delta: the number to increase the counter with
+
+        Returns:
+            the value of the counter after the increase
+        """
+        with self._condition:
+            self._value += delta
+            if self._waiters and self._value:
+                self._condition.notify_all()
+            return self._value
+
+    def compare_and_set(self, expected: int, new_value: int) -> bool:
+        """Atomically sets the value of the counter to a new value if its
+        current value is equal to the expected value.
+
+        Parameters:
+            expected: the expected current value of the counter
+            new_value: the new value of the counter
+
+        Returns:
+            whether the value of the counter was updated
+        """
+        with self._condition:
+            if self._value != expected:
+                return False
+            self._value = new_value
+            if self._waiters and self._value:
+                self._condition.notify_all()
+            return True
 
     def decrease(self, delta: int = 1) -> None:
         """Increases the value of the counter atomically with the given value.
@@ -58,18 +113,25 @@ class AtomicCounter:
         """
         with self._condition:
             self._value += delta
-            self._condition.notify_all()
+            if self._waiters and self._value:
+                self._condition.notify_all()
 
     @property
     def value(self) -> int:
-        """The current value of the counter."""
+        """The current value of the counter.
+
+        Reading the value does not acquire the lock of the counter; the
+        value is always read in a single step, so readers never see a
+        partially updated counter.
+        """
         return self._value
 
     @value.setter
     def value(self, new_value: int) -> None:
         with self._condition:
             self._value = new_value
-            self._condition.notify_all()
+            if self._waiters and self._value:
+                self._condition.notify_all()
 
     def wait(self, timeout: Optional[float] = None) -> int:
         """Waits until the counter becomes nonzero, then returns the value of
@@ -83,12 +145,7 @@ class AtomicCounter:
             the value of the counter
         """
         with self._condition:
-            if timeout is None:
-                while self._value == 0:
-                    self._condition.wait()
-            else:
-                if self._value == 0:
-                    self._condition.wait(timeout)
+            self._wait_for_nonzero_value(timeout)
             return self._value
 
     def wait_and_reset(self, timeout: Optional[float] = None) -> int:
@@ -103,20 +160,41 @@ class AtomicCounter:
             the value of the counter before it was reset to zero
         """
         with self._condition:
-            if timeout is None:
-                while self._value == 0:
-                    self._condition.wait()
-            else:
-                if self._value == 0:
-                    self._condition.wait(timeout)
+            self._wait_for_nonzero_value(timeout)
 
+            # No need to notify anyone here; waiting threads wait for the
+            # counter to become nonzero so they would go back to sleep anyway
             result = self._value
             self._value = 0
-            if result != 0:
-                self._condition.notify_all()
 
             return result
 
+    def _wait_for_nonzero_value(self, timeout: Optional[float]) -> None:
+        """Waits until the counter becomes nonzero. Must be called with the
+        condition variable held.
+
+        Waiting threads are counted so the methods modifying the counter can
+        skip notifying the condition variable when nobody is waiting.
+        """
+        if self._value != 0:
+            return
+
+        self._waiters += 1
+        try:
+            if timeout is None:
+                while self._value == 0:
+                    self._condition.wait()
+            else:
+                # Keep on waiting after spurious wakeups until the deadline
+                deadline = monotonic() + timeout
+                while self._value == 0:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+        finally:
+            self._waiters -= 1
+
 
 class CancellableThread(Thread):
     """A thread subclass that can be cancelled by invoking its
@@ -144,6 +222,7 @@ class SelectableQueue(Generic[T]):
     """
 
     _notifier: "FDNotifier"
+    _notify: Callable[[], None]
     _queue: queue.Queue[T]
 
     def __init__(
@@ -164,6 +243,9 @@ class SelectableQueue(Generic[T]):
             self._queue = queue_or_factory
         self._notifier = FDNotifier()
 
+        # Cache the bound method as put() calls it for every item
+        self._notify = self._notifier.notify
+
     def __del__(self):
         self.close()
 
@@ -177,6 +259,11 @@ class SelectableQueue(Generic[T]):
     def fd(self) -> int:
         """The file descriptor that becomes readable when items are put
         into the queue.
+
+        The file descriptor can be used both with level-triggered (``select()``,
+        ``poll()``) and edge-triggered (``epoll`` with ``EPOLLET``) readiness
+        notification. In the latter case, ``get_all()`` must be called after
+        every readiness event as it is the call that re-arms the notification.
         """
         return self._notifier.fd
 
@@ -198,15 +285,33 @@ class SelectableQueue(Generic[T]):
 
         self._notifier.drain()
 
+        # Drain the queue while holding its lock only once instead of calling
+        # get_nowait() repeatedly. _qsize() and _get() are the hooks that
+        # Queue subclasses override so this preserves their ordering.
+        q = self._queue
         result: List[T] = []
-        try:
-            while True:
-                result.append(self._queue.get_nowait())
-        except queue.Empty:
-            pass
+        with q.mutex:
+            while q._qsize():  # type: ignore
+                result.append(q._get())  # type: ignore
+            if result:
+                q.not_full.notify_all()
 
         return result
 
+    def register_with_epoll(self, ep: "select.epoll", events: Optional[int] = None):
+        """Registers the file descriptor of the queue in the given ``epoll``
+        object.
+
+        Parameters:
+            ep: the ``epoll`` object to register the file descriptor with
+            events: the event mask to register the file descriptor with.
+                ``None`` means ``EPOLLIN | EPOLLET``, i.e. edge-triggered
+                notifications when the queue becomes non-empty.
+        """
+        if events is None:
+            events = select.EPOLLIN | select.EPOLLET
+        ep.register(self.fd, events)
+
     def put(self, item: T, block: bool = True, timeout: Optional[float] = None) -> None:
         """Puts an item in the queue.
 
@@ -222,7 +327,7 @@ class SelectableQueue(Generic[T]):
                 within the given timeout (or if we were not allowed to block)
         """
         self._queue.put(item, block, timeout)
-        self._notifier.notify()
+        self._notify()
 
     def put_nowait(self, item: T) -> None:
         """Puts an item in the queue if it is not full.
@@ -237,29 +342,133 @@ class SelectableQueue(Generic[T]):
 
 
 class WorkerThread(CancellableThread):
-    """Worker thread that receives callable objects from a queue and executes
-    them one by one.
+    """Worker thread that receives callable objects from its own job queue
+    and executes them one by one.
+
+    Worker threads that were given a shared queue when they were constructed
+    receive their jobs from that queue instead, and call its ``task_done()``
+    method after each job.
+
+    When its own queue is empty, the worker thread attempts to steal jobs from
+    the end of the queues of its peers before going to sleep. Sleeping worker
+    threads are woken up when a job is submitted to a busy peer so they can
+    steal it.
     """
 
-    def __init__(self, queue, *args, **kwds):
+    _idle_workers: "_IdleWorkerSet"
+    _jobs: Deque["ThreadPoolJob"]
+    _peers: Sequence["WorkerThread"]
+    _pending: "_PendingJobCounter"
+    _queue: Optional["queue.Queue[Optional[ThreadPoolJob]]"]
+    _wake: Event
+
+    def __init__(
+        self,
+        queue: Optional["queue.Queue[Optional[ThreadPoolJob]]"] = None,
+        *args,
+        pending: Optional["_PendingJobCounter"] = None,
+        idle_workers: Optional["_IdleWorkerSet"] = None,
+        **kwds,
+    ):
         """Constructor.
 
         Parameters:
-            queue (Queue): the queue from which the worker thread receives
-                its jobs
+            queue: a shared queue from which the worker thread receives its
+                jobs; ``None`` means that the worker thread receives its jobs
+                in its own queue via ``submit_many()``
+            pending: counter of unfinished jobs in the thread pool that the
+                worker thread belongs to; it is decreased whenever the worker
+                thread finishes a job
+            idle_workers: set of the idle worker threads in the thread pool
+                that the worker thread belongs to; the worker thread adds
+                itself to this set while it is waiting for jobs
         """
         super(WorkerThread, self).__init__(*args, **kwds)
         self.daemon = True
+        self._idle_workers = (
+            idle_workers if idle_workers is not None else _IdleWorkerSet()
+        )
+        self._jobs = deque()
+        self._peers = ()
+        self._pending = pending if pending is not None else _PendingJobCounter()
         self._queue = queue
+        self._wake = Event()
 
     def request_stop(self):
         """Requests the thread to stop as soon as possible."""
         super(WorkerThread, self).request_stop()
-        self._queue.put(None)  # to unblock the main loop
+        if self._queue is not None:
+            self._queue.put(None)  # to unblock the main loop
+        else:
+            self._wake.set()  # to unblock the main loop
+
+    def submit_many(self, jobs: Iterable["ThreadPoolJob"]) -> None:
+        """Adds multiple jobs to the queue of the worker thread, waking up the
+        worker thread only once.
+
+        Parameters:
+            jobs: the jobs to add
+        """
+        self._jobs.extend(jobs)
+        self._wake.set()
 
     def run(self):
+        if self._queue is not None:
+            self._run_from_queue(self._queue)
+            return
+
+        idle_workers, wake = self._idle_workers, self._wake
+        while not self.is_stop_requested:
+            job = self._next_job()
+            if job is None:
+                # Clear the event and register as idle *before* looking for
+                # jobs again. Submitters add their jobs first and look for
+                # idle workers afterwards, so a job submitted meanwhile is
+                # either found here or the submitter sees us as idle.
+                wake.clear()
+                idle_workers.add(self)
+                job = self._next_job()
+                if job is None:
+                    wake.wait()
+                    idle_workers.discard(self)
+                    continue
+                if not idle_workers.discard(self):
+                    # A submitter has picked us as an idle worker in the
+                    # meanwhile but we are busy now; let someone else steal
+                    # the job that it gives us
+                    idle_workers.wake_one()
+
+            error, result = None, None
+            try:
+                result = job._execute()
+            except Exception as ex:
+                error = ex
+            finally:
+                self._pending.decrease()
+
+            job._notify(result, error)
+
+        idle_workers.discard(self)
+
+        # Discard the jobs that we did not get to so nobody waits for them
+        # forever in ThreadPool.wait_for_completion()
+        jobs = self._jobs
+        num_discarded = 0
+        while True:
+            try:
+                jobs.pop()
+            except IndexError:
+                break
+            num_discarded += 1
+        if num_discarded:
+            self._pending.decrease(num_discarded)
+
+    def _run_from_queue(self, queue: "queue.Queue[Optional[ThreadPoolJob]]"):
+        """Main loop of the worker thread when it receives its jobs from a
+        shared queue.
+        """
         while not self.is_stop_requested:
-            job = self._queue.get()
+            job = queue.get()
             if job is None:
                 continue
 
@@ -269,14 +478,63 @@ class WorkerThread(CancellableThread):
             except Exception as ex:
                 error = ex
             finally:
-                self._queue.task_done()
+                queue.task_done()
 
             job._notify(result, error)
 
+    def _next_job(self) -> Optional["ThreadPoolJob"]:
+        """Returns the next job from the queue of this worker thread, or a
+        job stolen from one of its peers if its own queue is empty.
+
+        Returns:
+            the next job to execute or ``None`` if there are no jobs to take
+        """
+        try:
+            return self._jobs.popleft()
+        except IndexError:
+            # Our queue is empty (or a peer has just stolen its last job)
+            return self._steal_job()
+
+    def _steal_job(self) -> Optional["ThreadPoolJob"]:
+        """Attempts to steal a job from the end of the queue of one of the
+        peers of this worker thread, visiting the peers in a random order.
+
+        Returns:
+            the stolen job or ``None`` if all the peers are idle
+        """
+        peers = self._peers
+        num_peers = len(peers)
+        if num_peers < 2:
+            return None
+
+        offset = randrange(num_peers)
+        for index in range(num_peers):
+            peer = peers[(offset + index) % num_peers]
+            if peer is self:
+                continue
+            try:
+                # The owner pops from the left so we pop from the right to
+                # keep contention low; deque.pop() is atomic
+                return peer._jobs.pop()
+            except IndexError:
+                pass
+
+        return None
+
 
 class ThreadPoolJob(Generic[T]):
     """Object representing a job that was submitted to the thread pool."""
 
+    __slots__ = (
+        "_args",
+        "_func",
+        "_kwds",
+        "_on_error",
+        "_on_result",
+        "_on_terminated",
+        "_result_and_error",
+    )
+
     _func: Callable[..., T]
     _result_and_error: Optional[Tuple[Optional[T], Optional[Exception]]]
 
@@ -303,8 +561,15 @@ class ThreadPoolJob(Generic[T]):
         self._on_terminated = None
 
     def _execute(self) -> T:
-        """Executes the job in the current thread."""
-        return self._func(*self._args, **self._kwds)
+        """Executes the job in the current thread.
+
+        The job releases its references to the function and its arguments
+        so they can be freed as soon as the job has finished, even if the
+        job object itself is kept alive by the submitter.
+        """
+        func, args, kwds = self._func, self._args, self._kwds
+        self._func = self._args = self._kwds = None  # type: ignore
+        return func(*args, **kwds)
 
     def _notify(self, result: Optional[T], error: Optional[Exception]) -> None:
         """Notifies the job about its execution result so it can call the
@@ -315,32 +580,18 @@ class ThreadPoolJob(Generic[T]):
 
         self._result_and_error = result, error
 
-        self._call_result_handler_if_needed()
-        self._call_error_handler_if_needed()
-        self._call_termination_handler_if_needed()
-
-    def _call_error_handler_if_needed(self) -> None:
-        if self._result_and_error is None or self._on_error is None:
-            return
-
-        _, error = self._result_and_error
-        if error is not None:
-            self._on_error(error)
-
-    def _call_result_handler_if_needed(self) -> None:
-        if self._result_and_error is None or self._on_result is None:
-            return
-
-        result, error = self._result_and_error
         if error is None:
-            self._on_result(result)
-
-    def _call_termination_handler_if_needed(self) -> None:
-        if self._result_and_error is None or self._on_terminated is None:
-            return
+            on_result = self._on_result
+            if on_result is not None:
+                on_result(result)
+        else:
+            on_error = self._on_error
+            if on_error is not None:
+                on_error(error)
 
-        _, error = self._result_and_error
-        self._on_terminated(error)
+        on_terminated = self._on_terminated
+        if on_terminated is not None:
+            on_terminated(error)
 
     def then(
         self,
@@ -364,7 +615,11 @@ class ThreadPoolJob(Generic[T]):
             raise TypeError("result handler must be callable")
         self._on_result = func
 
-        self._call_result_handler_if_needed()
+        result_and_error = self._result_and_error
+        if result_and_error is not None:
+            result, error = result_and_error
+            if error is None:
+                func(result)
 
         if on_error is not None:
             self.catch_(on_error)
@@ -384,7 +639,11 @@ class ThreadPoolJob(Generic[T]):
             raise TypeError("error handler must be callable")
         self._on_error = func
 
-        self._call_error_handler_if_needed()
+        result_and_error = self._result_and_error
+        if result_and_error is not None:
+            _, error = result_and_error
+            if error is not None:
+                func(error)
 
     def finally_(self, func: Callable[[Optional[Exception]], None]) -> None:
         """Registers a handler function to call when the job has finished,
@@ -402,7 +661,9 @@ class ThreadPoolJob(Generic[T]):
             raise TypeError("termination handler must be callable")
         self._on_terminated = func
 
-        self._call_termination_handler_if_needed()
+        result_and_error = self._result_and_error
+        if result_and_error is not None:
+            func(result_and_error[1])
 
 
 class ThreadPool:
@@ -410,23 +671,42 @@ class ThreadPool:
     distributes tasks between them.
     """
 
-    _queue: queue.Queue[ThreadPoolJob]
+    _idle_workers: "_IdleWorkerSet"
+    _job_counter: Iterator[int]
+    _pending: "_PendingJobCounter"
     _threads: List[WorkerThread]
 
-    def __init__(self, num_threads: int = 5):
+    def __init__(self, num_threads: int = 5, max_pending: Optional[int] = None):
         """Constructor.
 
         Parameters:
             num_threads: the number of threads in the pool
+            max_pending: maximum number of jobs that may be submitted to the
+                pool without having finished yet. Submitting a job blocks while
+                the limit is reached. ``None`` means no limit, i.e. submitting
+                a job never blocks.
         """
-        self._queue = queue.Queue(num_threads)
-        self._threads = [WorkerThread(self._queue) for _ in range(num_threads)]
-        for thread in self._threads:
+        self._idle_workers = _IdleWorkerSet()
+        self._pending = _PendingJobCounter(max_pending)
+        self._threads = [
+            WorkerThread(pending=self._pending, idle_workers=self._idle_workers)
+            for _ in range(num_threads)
+        ]
+        self._job_counter = count()
+
+        # Workers get a snapshot of their peers that does not change when the
+        # pool is stopped while they are stealing jobs
+        peers = tuple(self._threads)
+        for thread in peers:
+            thread._peers = peers
             thread.start()
 
     def stop(self) -> None:
-        while self._threads:
-            thread = self._threads.pop()
+        # The list of threads is replaced instead of being emptied in place so
+        # submitters that have already fetched it see a list that does not
+        # shrink under them
+        threads, self._threads = self._threads, []
+        for thread in reversed(threads):
             thread.request_stop()
 
     def submit(self, *args, **kwds) -> ThreadPoolJob:
@@ -435,22 +715,184 @@ class ThreadPool:
         The first positional argument is the function to call when the job is
         executed. Additional positional and keyword arguments are passed down
         to the function being called.
+
+        Each worker thread has its own job queue so submitters do not contend
+        for a single shared lock. The job is given to an idle worker thread if
+        there is one; otherwise the worker threads take turns in receiving
+        the jobs.
         """
         if not args:
             raise TypeError("at least one positional argument is needed")
 
+        threads = self._threads
+        if not threads:
+            raise RuntimeError("thread pool is already stopped")
+
         job = ThreadPoolJob(args[0], args[1:], kwds)
-        self._queue.put(job)
+        self._pending.increase()
+        self._dispatch(threads, [job])
 
         return job
 
+    def submit_bulk(self, func: Callable[..., T], *iterables) -> List[ThreadPoolJob[T]]:
+        """Submits multiple jobs to the thread pool in a single step.
+
+        The jobs are created similarly to the built-in ``map()`` function:
+        the function is called with the first items of the iterables as
+        positional arguments in the first job, with the second items in the
+        second job and so on, until the shortest iterable is exhausted. The
+        jobs are split evenly between the worker threads, preferring the idle
+        ones, and each worker thread is woken up only once.
+
+        Parameters:
+            func: the function to call in each job
+
+        Returns:
+            the list of submitted jobs, in the order of their arguments
+        """
+        threads = self._threads
+        if not threads:
+            raise RuntimeError("thread pool is already stopped")
+
+        jobs = [ThreadPoolJob(func, args, {}) for args in zip(*iterables)]
+        if not jobs:
+            return jobs
+
+        chunk_size = -(-len(jobs) // len(threads))
+
+        self._pending.increase(len(jobs))
+        for start in range(0, len(jobs), chunk_size):
+            self._dispatch(threads, jobs[start : (start + chunk_size)])
+
+        return jobs
+
     def wait_for_completion(self) -> None:
-        self._queue.join()
+        self._pending.wait_until_zero()
+
+    def _dispatch(
+        self, threads: Sequence[WorkerThread], jobs: List[ThreadPoolJob]
+    ) -> None:
+        """Adds the given jobs to the queue of an idle worker thread, or to
+        the queue of the next worker thread in turn if all of them are busy.
+
+        Parameters:
+            threads: the non-empty list of worker threads of the pool, as
+                fetched by the caller
+            jobs: the jobs to add
+        """
+        idle_workers = self._idle_workers
+        worker = idle_workers.pop()
+        if worker is not None:
+            worker.submit_many(jobs)
+            return
+
+        threads[next(self._job_counter) % len(threads)].submit_many(jobs)
+
+        # A worker thread may have become idle since we looked; wake it up so
+        # it can steal the jobs instead of waiting for the busy one
+        idle_workers.wake_one()
 
     def __del__(self):
         self.stop()
 
 
+class _IdleWorkerSet:
+    """Set of the worker threads of a thread pool that are waiting for jobs."""
+
+    _lock: Lock
+    _workers: Set[WorkerThread]
+
+    def __init__(self):
+        """Constructor."""
+        self._lock = Lock()
+        self._workers = set()
+
+    def add(self, worker: WorkerThread) -> None:
+        """Marks the given worker thread as idle."""
+        with self._lock:
+            self._workers.add(worker)
+
+    def discard(self, worker: WorkerThread) -> bool:
+        """Marks the given worker thread as busy if it was idle.
+
+        Returns:
+            whether the worker thread was in the set
+        """
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+                return True
+            return False
+
+    def pop(self) -> Optional[WorkerThread]:
+        """Removes an arbitrary idle worker thread from the set and returns
+        it, or returns ``None`` if there are no idle worker threads.
+        """
+        if not self._workers:
+            # Fast path without locking when all the workers are busy
+            return None
+        with self._lock:
+            return self._workers.pop() if self._workers else None
+
+    def wake_one(self) -> None:
+        """Wakes up an arbitrary idle worker thread so it can steal jobs from
+        its peers. No-op if there are no idle worker threads.
+        """
+        worker = self.pop()
+        if worker is not None:
+            worker._wake.set()
+
+
+class _PendingJobCounter:
+    """Counter of jobs that were submitted to a thread pool but have not
+    finished yet, with a method to wait until all the jobs have finished.
+    """
+
+    _condition: Condition
+    _limit: Optional[int]
+    _value: int
+
+    def __init__(self, limit: Optional[int] = None):
+        """Constructor.
+
+        Parameters:
+            limit: the value that ``increase()`` may not push the counter
+                above; ``None`` means no limit
+        """
+        self._condition = Condition()
+        self._limit = limit
+        self._value = 0
+
+    def decrease(self, delta: int = 1) -> None:
+        """Decreases the counter with the given value, notifying the waiting
+        threads if the counter reached zero or went below its limit.
+        """
+        with self._condition:
+            self._value -= delta
+            if self._value <= 0 or (
+                self._limit is not None and self._value < self._limit
+            ):
+                self._condition.notify_all()
+
+    def increase(self, delta: int = 1) -> None:
+        """Increases the counter with the given value, blocking while the
+        counter would go above its limit. An increase larger than the limit
+        is allowed when the counter is zero.
+        """
+        with self._condition:
+            limit = self._limit
+            if limit is not None:
+                while self._value > 0 and self._value + delta > limit:
+                    self._condition.wait()
+            self._value += delta
+
+    def wait_until_zero(self) -> None:
+        """Blocks until the counter reaches zero."""
+        with self._condition:
+            while self._value > 0:
+                self._condition.wait()
+
+
 class _PosixFDNotifier:
     """Notifier object that provides a file descriptor that becomes ready
     for reading whenever the user calls the ``notify()`` method of the
@@ -470,14 +912,21 @@ class _PosixFDNotifier:
     It is the responsibility of the user to call ``drain()`` when the
     readable end becomes readable.
 
+    Consecutive calls to ``notify()`` without a ``drain()`` in between write
+    only a single character into the pipe.
+
     Attributes:
         fd (int): the file descriptor to block on in a ``select()`` call
     """
 
+    _pending: Lock
     _readable_pipe: Optional[int]
     _writable_pipe: Optional[int]
 
     def __init__(self):
+        # Non-blocking acquisition of a lock is an atomic test-and-set
+        # operation; the lock is held while there is an undrained notification
+        self._pending = Lock()
         self._readable_pipe, self._writable_pipe = self._prepare_pipes()
 
     def __del__(self):
@@ -493,14 +942,26 @@ class _PosixFDNotifier:
 
         while True:
             try:
-                os.read(pipe, 1)
+                if len(os.read(pipe, 4096)) < 4096:
+                    # Short read; the pipe is drained
+                    break
             except OSError as ex:
                 if ex.errno == errno.EAGAIN:
                     # The pipe is drained
-                    return
+                    break
                 else:
                     raise
 
+        # Reset the flag only after the pipe was drained. If we did it before,
+        # a notify() call in between could write a character that we would
+        # consume here, leaving the flag set with an empty pipe, and further
+        # notifications would then be lost.
+        try:
+            self._pending.release()
+        except RuntimeError:
+            # Flag was not set
+            pass
+
     @property
     def fd(self) -> int:
         assert self._readable_pipe is not None, "queue is already closed"
@@ -524,7 +985,71 @@ class _PosixFDNotifier:
 
     def notify(self) -> None:
         assert self._writable_pipe is not None, "queue is already closed"
-        os.write(self._writable_pipe, b"x")
+        if self._pending.acquire(False):
+            os.write(self._writable_pipe, b"x")
+
+
+class _EventFDNotifier:
+    """Notifier object that provides a file descriptor that becomes ready
+    for reading whenever the user calls the ``notify()`` method of the
+    notifier.
+
+    This class provides the same interface as _PosixFDNotifier_ but it uses
+    a single Linux ``eventfd`` file descriptor instead of a pair of pipes.
+    The kernel accumulates notifications in a counter so ``drain()`` needs a
+    single read to consume all of them.
+
+    Consecutive calls to ``notify()`` without a ``drain()`` in between write
+    to the file descriptor only once.
+
+    Attributes:
+        fd (int): the file descriptor to block on in a ``select()`` call
+    """
+
+    _eventfd: Optional[int]
+    _pending: Lock
+
+    def __init__(self):
+        self._pending = Lock()
+        self._eventfd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+
+    def __del__(self):
+        self.close()
+
+    def drain(self) -> None:
+        """Drains the file descriptor by resetting its counter to zero."""
+        fd = self._eventfd
+        if fd is None:
+            return
+
+        try:
+            os.eventfd_read(fd)
+        except OSError as ex:
+            if ex.errno != errno.EAGAIN:
+                raise
+
+        # See _PosixFDNotifier.drain() for why this must happen after the read
+        try:
+            self._pending.release()
+        except RuntimeError:
+            # Flag was not set
+            pass
+
+    @property
+    def fd(self) -> int:
+        assert self._eventfd is not None, "queue is already closed"
+        return self._eventfd
+
+    def close(self) -> None:
+        """Closes the notifier. No-op if the notifier is already closed."""
+        if self._eventfd is not None:
+            fd, self._eventfd = self._eventfd, None
+            os.close(fd)
+
+    def notify(self) -> None:
+        assert self._eventfd is not None, "queue is already closed"
+        if self._pending.acquire(False):
+            os.eventfd_write(self._eventfd, 1)
 
 
-FDNotifier = _PosixFDNotifier
+FDNotifier = _EventFDNotifier if hasattr(os, "eventfd") else _PosixFDNotifier
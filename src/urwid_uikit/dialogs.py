@@ -1,8 +1,7 @@
 """Helper widgets for implementing dialog boxes"""
 
-from functools import partial
 from urwid import AttrMap, Overlay, Widget, WidgetPlaceholder
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, List, Optional
 
 from .graphics import PatchedLineBox
 from .types import TextOrMarkup
@@ -13,8 +12,29 @@ __all__ = ("DialogOverlay",)
 #: Type alias for on_close callbacks in a dialog overlay
 CloseCallback = Callable[[Widget], bool]
 
-#: Type alias for on_close callbacks in a dialog overlay
-BoundCloseCallback = Callable[[], bool]
+
+class _DialogEntry:
+    """Entry in the stack of dialogs shown in a dialog overlay."""
+
+    __slots__ = ("dialog", "on_close", "widget")
+
+    dialog: Widget
+    """The dialog that was opened by the user."""
+
+    on_close: Optional[CloseCallback]
+    """Callback to call with the dialog when it is about to be closed."""
+
+    widget: Widget
+    """The widget that is shown in the overlay for the dialog; typically the
+    dialog itself, wrapped in a frame and an AttrMap_.
+    """
+
+    def __init__(
+        self, widget: Widget, dialog: Widget, on_close: Optional[CloseCallback]
+    ):
+        self.widget = widget
+        self.dialog = dialog
+        self.on_close = on_close
 
 
 class DialogOverlay(WidgetPlaceholder):
@@ -22,7 +42,8 @@ class DialogOverlay(WidgetPlaceholder):
     a layer that shows modal dialogs.
     """
 
-    _stack: List[Tuple[Widget, Optional[BoundCloseCallback]]]
+    _stack: List[_DialogEntry]
+    _top: Optional[_DialogEntry]
 
     def __init__(self, app_widget: Widget):
         """Constructor.
@@ -33,6 +54,7 @@ class DialogOverlay(WidgetPlaceholder):
         """
         super().__init__(app_widget)
         self._stack = []
+        self._top = None
 
     def close(self) -> bool:
         """Closes all widgets currently in the overlay.
@@ -54,23 +76,26 @@ class DialogOverlay(WidgetPlaceholder):
             if the `on_close` callback of the topmost widget prevented the
             operation
         """
-        if not self._stack:
+        top = self._top
+        if top is None:
             return None
 
-        widget, on_close = self._stack[-1]
-        can_close = on_close() if on_close else True
+        on_close = top.on_close
+        can_close = on_close(top.dialog) if on_close else True
 
         if can_close:
             self.original_widget = self.original_widget.bottom_w
-            self._stack.pop()
-            return widget
+            stack = self._stack
+            stack.pop()
+            self._top = stack[-1] if stack else None
+            return top.widget
         else:
             return None
 
     @property
     def has_content(self) -> bool:
         """Returns whether there is at least one dialog open."""
-        return len(self._stack) > 0
+        return self._top is not None
 
     def open_dialog(
         self,
@@ -111,11 +136,12 @@ class DialogOverlay(WidgetPlaceholder):
             height="pack",
         )
 
-        self._stack.append((widget, partial(on_close, dialog) if on_close else None))
+        self._top = _DialogEntry(widget, dialog, on_close)
+        self._stack.append(self._top)
 
     def keypress(self, size, key: str):
         """Handler called when a key is pressed in the overlay."""
-        if key == "esc" and self.has_content:
+        if key == "esc" and self._top is not None:
             self.close_topmost_dialog()
         else:
             return super().keypress(size, key)
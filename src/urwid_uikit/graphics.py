@@ -1,4 +1,5 @@
-from urwid import LineBox
+from typing import Optional, Tuple
+from urwid import CanvasCache, LineBox
 
 
 __all__ = ("PatchedLineBox",)
@@ -11,6 +12,19 @@ class PatchedLineBox(LineBox):
 
     _sizing = frozenset(["box", "fixed", "flow"])
 
+    _title_width: int
+    """Minimum width of the box needed to show the title."""
+
+    _packed_size: Optional[Tuple[int, int]] = None
+    """Result of the last call to ``pack()`` in fixed size mode."""
+
+    _packed_focus: bool = False
+    """Focus flag of the last render at the size stored in ``_packed_size``."""
+
+    def __init__(self, *args, **kwds):
+        super().__init__(*args, **kwds)
+        self._update_title_width()
+
     def keypress(self, size, key: str):
         if not size:
             size = self.pack(size)
@@ -18,22 +32,41 @@ class PatchedLineBox(LineBox):
 
     def pack(self, size, focus: bool = False):
         if not size:
+            # If the canvas that we rendered at the last packed size is still
+            # in urwid's canvas cache, neither this widget nor any of its
+            # descendants has been invalidated since then, so the size of the
+            # decorated widget could not have changed either
+            packed_size = self._packed_size
+            if packed_size is not None and CanvasCache.fetch(
+                self, PatchedLineBox, packed_size, self._packed_focus
+            ):
+                return packed_size
+
             # Fixed size; ask the decorated widget for its size and then add
             # 1 on each side. Also take into account the title (if any)
-            if self.title_widget:
-                min_width = len(self.title_widget.text) + 2
-            else:
-                min_width = 0
             if self.original_widget:
                 w, h = self.original_widget.pack(size)
             else:
                 w, h = 0, 0
-            w = max(min_width, w)
-            return (w + 2, h + 2)
+            w = max(self._title_width, w)
+            self._packed_size = packed_size = (w + 2, h + 2)
+            return packed_size
         else:
             return super().pack(size, focus)
 
+    def set_title(self, text: str) -> None:
+        super().set_title(text)
+        self._update_title_width()
+
+    def _update_title_width(self) -> None:
+        if self.title_widget:
+            self._title_width = len(self.title_widget.text) + 2
+        else:
+            self._title_width = 0
+
     def render(self, size, focus: bool = False):
         if not size:
             size = self.pack(size, focus)
+        if size == self._packed_size:
+            self._packed_focus = focus
         return super().render(size, focus)
@@ -1,4 +1,4 @@
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional
 from urwid import AttrMap, Filler, GridFlow, Widget, WidgetWrap
 from urwid.command_map import (
     command_map,
@@ -11,6 +11,7 @@ from urwid.command_map import (
     CURSOR_MAX_RIGHT,
 )
 
+from .list import _FOCUSED_ATTR
 from .mixins import ObjectContainerMixin
 
 __all__ = ("Grid", "ObjectGrid")
@@ -49,7 +50,7 @@ class Grid(WidgetWrap):
             index: the insertion index; ``None`` means the end of the grid
         """
         # Wrap the widget in an AttrMap before it actually gets inserted
-        wrapped_widget = AttrMap(widget, "", "list focus")
+        wrapped_widget = AttrMap(widget, "", _FOCUSED_ATTR)
         options = self._grid_flow.options()
 
         # Do the insertion
@@ -164,6 +165,23 @@ class Grid(WidgetWrap):
         """
         self._grid_flow.contents.pop(index)
 
+    def _bulk_set_body(self, widgets: Iterable[Widget]) -> None:
+        """Replaces all the widgets in the grid with the given ones in a
+        single step so the grid sends a single change notification.
+
+        Widgets that are already in the grid keep their existing wrappers.
+
+        Parameters:
+            widgets: the new widgets of the grid, in order
+        """
+        contents = self._grid_flow.contents
+        entries = {id(entry[0].base_widget): entry for entry in contents}
+        options = self._grid_flow.options()
+        contents[:] = [
+            entries.get(id(widget)) or (AttrMap(widget, "", _FOCUSED_ATTR), options)
+            for widget in widgets
+        ]
+
     def _get_focus_position_safe(self) -> int:
         try:
             return self.focus_position
@@ -1,21 +1,32 @@
 """Widgets containing lists of various things."""
 
-from typing import Iterator, Optional
-from urwid import AttrMap, ListBox, SimpleFocusListWalker, Widget
+from sys import intern
+from typing import Iterable, Iterator, Optional
+from urwid import AttrMap, ListBox, ListWalker, SimpleFocusListWalker, Widget
 
 from .mixins import ObjectContainerMixin
 
 __all__ = ("List", "ObjectList")
 
+#: Attribute of focused list and grid items; interned once so that all the
+#: AttrMap wrappers share the same string
+_FOCUSED_ATTR = intern("list focus")
+
 
 class List(ListBox):
     """List box that shows a list of widgets and has a single focused
     widget that is displayed differently.
     """
 
-    def __init__(self):
-        """Constructor."""
-        super().__init__(SimpleFocusListWalker([]))
+    def __init__(self, walker: Optional[ListWalker] = None):
+        """Constructor.
+
+        Parameters:
+            walker: the list walker that stores the widgets of the list box.
+                It must support ``append()``, ``insert()`` and ``pop()`` like
+                a Python list. Defaults to an empty ``SimpleFocusListWalker``.
+        """
+        super().__init__(SimpleFocusListWalker([]) if walker is None else walker)
 
     def add_widget(self, widget: Widget, index: Optional[int] = None) -> None:
         """Adds a new widget to the list box.
@@ -25,14 +36,13 @@ class List(ListBox):
             index: the insertion index; ``None`` means the end of the list
         """
         # Wrap the widget in an AttrMap before it actually gets inserted
-        wrapped_widget = AttrMap(widget, "", "list focus")
+        wrapped_widget = self._wrap_widget(widget)
 
         # Do the insertion
         if index is None:
             self.body.append(wrapped_widget)
         else:
             self.body.insert(index, wrapped_widget)
-        self._invalidate()
 
     @property
     def focused_widget(self) -> Optional[Widget]:
@@ -84,6 +94,27 @@ class List(ListBox):
         """
         self.body.pop(index)
 
+    def _bulk_set_body(self, widgets: Iterable[Widget]) -> None:
+        """Replaces all the widgets in the list box with the given ones in a
+        single step so the list walker sends a single change notification.
+
+        Widgets that are already in the list keep their existing wrappers.
+
+        Parameters:
+            widgets: the new widgets of the list box, in order
+        """
+        wrappers = {id(wrapper.base_widget): wrapper for wrapper in self.body}
+        self.body[:] = [
+            wrappers.get(id(widget)) or self._wrap_widget(widget) for widget in widgets
+        ]
+
+    @staticmethod
+    def _wrap_widget(widget: Widget) -> Widget:
+        """Wraps a widget in an AttrMap that highlights it when it is focused,
+        before it is added to the list box.
+        """
+        return AttrMap(widget, "", _FOCUSED_ATTR)
+
 
 class ObjectList(List, ObjectContainerMixin):
     """List box that shows a list of widgets such that each widget is
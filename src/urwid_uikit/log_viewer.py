@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import deque
 from logging import getLogger, Formatter, Handler, Logger, LogRecord
-from typing import Dict, Optional, Union, TYPE_CHECKING
-from urwid import Divider, Widget, WidgetWrap
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Union, TYPE_CHECKING
+from time import time
+from urwid import Divider, ListWalker, Widget, WidgetWrap
 
 from .list import List
 from .text import SelectableText
@@ -18,6 +21,104 @@ def _create_marker():
     return Divider("\u2015")
 
 
+class _BoundedListWalker(ListWalker):
+    """List walker that holds at most a given number of entries. Appending an
+    entry to a full walker discards the oldest entry in O(1) time.
+
+    Entries that are not widgets are turned into widgets with a factory
+    function when they are accessed for the first time, so only the entries
+    that have been shown on the screen are backed by widgets.
+    """
+
+    _factory: Callable[[Any], Widget]
+    _focus: int
+    _items: Deque[Any]
+
+    def __init__(self, max_items: int, factory: Callable[[Any], Widget]):
+        """Constructor.
+
+        Parameters:
+            max_items: the maximum number of entries in the walker
+            factory: function that creates a widget from an entry that is
+                not a widget yet
+        """
+        self._factory = factory
+        self._focus = 0
+        self._items = deque(maxlen=max_items)
+
+    def __getitem__(self, position: int) -> Widget:
+        item = self._items[position]
+        if not isinstance(item, Widget):
+            self._items[position] = item = self._factory(item)
+        return item
+
+    def __iter__(self) -> Iterator[Widget]:
+        for position in range(len(self._items)):
+            yield self[position]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def append(self, item: Any) -> None:
+        items = self._items
+        if len(items) == items.maxlen and self._focus > 0:
+            # The oldest entry is about to be discarded
+            self._focus -= 1
+        items.append(item)
+        self._modified()
+
+    def insert(self, index: int, item: Any) -> None:
+        items = self._items
+        if index >= len(items):
+            self.append(item)
+            return
+
+        if len(items) == items.maxlen:
+            items.popleft()
+            index = max(index - 1, 0)
+            if self._focus > 0:
+                self._focus -= 1
+        items.insert(index, item)
+        if index <= self._focus and len(items) > 1:
+            self._focus += 1
+        self._modified()
+
+    def pop(self, index: int = -1) -> Widget:
+        items = self._items
+        if index < 0:
+            index += len(items)
+        widget = self[index]
+        del items[index]
+        if index < self._focus or self._focus >= len(items) > 0:
+            self._focus -= 1
+        self._modified()
+        return widget
+
+    @property
+    def focus(self) -> int:
+        return self._focus
+
+    def set_focus(self, position: int) -> None:
+        if not 0 <= position < len(self._items):
+            raise IndexError(f"No widget at position {position}")
+        self._focus = position
+        self._modified()
+
+    def next_position(self, position: int) -> int:
+        if position >= len(self._items) - 1:
+            raise IndexError
+        return position + 1
+
+    def prev_position(self, position: int) -> int:
+        if position <= 0:
+            raise IndexError
+        return position - 1
+
+    def positions(self, reverse: bool = False) -> Iterator[int]:
+        num_items = len(self._items)
+        return iter(range(num_items - 1, -1, -1) if reverse else range(num_items))
+
+
 class ColoredFormatterWrapper(Formatter):
     """Logging formatter that takes another formatter and wraps it such that
     the formatted result is color-coded according to the log level of the
@@ -26,6 +127,14 @@ class ColoredFormatterWrapper(Formatter):
 
     _formatter: Formatter
 
+    _get_prefix: Callable[[str, TextOrMarkup], TextOrMarkup]
+    """Function that returns the prefix of a log entry, given its level name
+    and a default prefix.
+    """
+
+    _default_prefix: TextOrMarkup = ("", "   ")
+    """Prefix of log entries whose level has no dedicated prefix."""
+
     _level_to_prefix: Dict[str, TextOrMarkup] = {
         "CRITICAL": ("error", " \N{BLACK CIRCLE} "),
         "DEBUG": ("debug", " \N{BLACK RIGHT-POINTING TRIANGLE} "),
@@ -42,10 +151,11 @@ class ColoredFormatterWrapper(Formatter):
                 `%(message)s`.
         """
         self._formatter = self._process_formatter(formatter)
+        self._get_prefix = self._level_to_prefix.get
 
     def format(self, record):
         result = self._formatter.format(record)
-        prefix = self._level_to_prefix.get(record.levelname, "   ")
+        prefix = self._get_prefix(record.levelname, self._default_prefix)
         return [prefix, result]
 
     def _process_formatter(
@@ -75,7 +185,7 @@ class LogViewerWidgetHandler(Handler):
     def emit(self, record: LogRecord) -> None:
         try:
             msg = self.format(record)
-            self._widget._add_entry(msg)
+            self._widget._add_entry(msg, record.created)
         except RecursionError:  # Python issue 36272
             raise
         except Exception:
@@ -91,6 +201,11 @@ class LogViewerWidget(WidgetWrap):
     _logger: Optional[Logger]
     _max_items: int
 
+    _timestamps: Deque[float]
+    """Creation times of the items in the list, in the same order as the
+    items themselves.
+    """
+
     def __init__(
         self, app: "Application", logger: Optional[Logger] = None, max_items: int = 2048
     ):
@@ -109,9 +224,10 @@ class LogViewerWidget(WidgetWrap):
 
         self._app = app
         self._handler = LogViewerWidgetHandler(self)
-        self._list = List()
         self._logger = None
         self._max_items = int(max_items)
+        self._list = List(_BoundedListWalker(self._max_items, self._create_line))
+        self._timestamps = deque(maxlen=self._max_items)
 
         self._handler.setFormatter(ColoredFormatterWrapper())
 
@@ -121,7 +237,9 @@ class LogViewerWidget(WidgetWrap):
 
     def add_marker(self) -> None:
         """Adds a new marker to the end of the list."""
-        self._app.call_on_ui_thread(self._add_item_on_ui_thread, _create_marker())
+        self._app.call_on_ui_thread(
+            self._add_item_on_ui_thread, _create_marker(), time()
+        )
 
     def focus_most_recent_item(self) -> None:
         """Sets the focus of the log viewer widget to the most recent item.
@@ -129,9 +247,8 @@ class LogViewerWidget(WidgetWrap):
         This item is assumed to be at the bottom of the list of log items. The
         function is a no-op if the list is empty.
         """
-        num_items = len(self._list.body)
-        if num_items > 0:
-            self._list.focus_position = num_items - 1
+        if len(self._list.body) > 0:
+            self._focus_last_item()
 
     @property
     def logger(self) -> Optional[Logger]:
@@ -151,33 +268,75 @@ class LogViewerWidget(WidgetWrap):
         if self._logger:
             self._logger.addHandler(self._handler)
 
-    def _add_entry(self, text: str) -> None:
-        """Adds a new log record to the end of the list.
+    def _add_entry(self, text: TextOrMarkup, timestamp: float) -> None:
+        """Adds a new log record to the list.
 
         Parameters:
-            text (str): the formatted text of the log record
+            text: the formatted text of the log record
+            timestamp: the time when the log record was created
         """
-        self._app.call_on_ui_thread(self._add_item_on_ui_thread, SelectableText(text))
+        self._app.call_on_ui_thread(self._add_item_on_ui_thread, text, timestamp)
 
-    def _add_item_on_ui_thread(self, widget: Widget) -> None:
-        """Adds a new item to the end of the list.
+    def _add_item_on_ui_thread(
+        self, item: Union[Widget, TextOrMarkup], timestamp: float
+    ) -> None:
+        """Adds a new item to the list such that the items remain sorted by
+        their timestamps. The new item is typically the most recent one so it
+        ends up at the end of the list.
 
-        This method *must* be called on the UI thread. It may remove some of
-        the topmost items from the list if there are too many items in the log.
+        This method *must* be called on the UI thread. The list walker
+        discards the topmost item if there are too many items in the log.
 
         Parameters:
-            widget (Widget): the widget to add
+            item: the widget to add, or the text of a log record. Widgets
+                for log records are created only when they are shown.
+            timestamp: the time when the item was created
         """
-        num_items = len(self._list.body)
-
-        at_bottom = num_items == 0 or self._list.focus_position == (num_items - 1)
+        body = self._list.body
+        timestamps = self._timestamps
+        num_items = len(body)
 
-        self._list.add_widget(widget)
+        at_bottom = num_items == 0 or body.focus == (num_items - 1)
 
-        if num_items >= self._max_items:
-            self._list.remove_widget_at(0)
+        if not timestamps or timestamp >= timestamps[-1]:
+            index = None
+            timestamps.append(timestamp)
         else:
-            num_items += 1
+            # Entry arrived out of order, e.g. from another logger that
+            # shares the widget
+            index = bisect_right(timestamps, timestamp)
+            if num_items >= self._max_items:
+                if index == 0:
+                    # Entry is older than everything in the list so it
+                    # would be discarded right away
+                    return
+                timestamps.popleft()
+                timestamps.insert(index - 1, timestamp)
+            else:
+                timestamps.insert(index, timestamp)
+
+        if isinstance(item, Widget):
+            self._list.add_widget(item, index)
+        elif index is None:
+            body.append(item)
+        else:
+            body.insert(index, item)
+
+        if at_bottom:
+            self._focus_last_item()
 
-        if num_items > 0 and at_bottom:
-            self._list.focus_position = num_items - 1
+    def _create_line(self, text: TextOrMarkup) -> Widget:
+        """Creates the widget that shows the text of a log record in the list."""
+        return self._list._wrap_widget(SelectableText(text))
+
+    def _focus_last_item(self) -> None:
+        """Moves the focus to the last item of the non-empty list.
+
+        The focus is moved in the walker directly and the list box scrolls
+        to the bottom when it is rendered next time. Going through
+        ``ListBox.focus_position`` would create a widget for the previously
+        focused entry even if it is never shown.
+        """
+        body = self._list.body
+        body.set_focus(len(body) - 1)
+        self._list.set_focus_valign("bottom")
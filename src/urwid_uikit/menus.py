@@ -1,6 +1,18 @@
 """Helper widgets for implementing dropdown menus"""
 
-from typing import Callable, Iterable, Optional, Sequence, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from urwid import (
     AttrMap,
     Button,
@@ -11,16 +23,36 @@ from urwid import (
     Widget,
     WidgetWrap,
     connect_signal,
-    disconnect_signal,
 )
+from weakref import WeakSet
 
 from .dialogs import DialogOverlay
 from .graphics import PatchedLineBox
 from .utils import extract_base_widget, tuplify
 
 
+class MenuSpec(NamedTuple):
+    """Parsed specification of a menu item. Menu items can be created from
+    these without parsing their titles again.
+    """
+
+    kind: str
+    """Kind of the menu item; one of ``"item"``, ``"separator"`` or
+    ``"submenu"``.
+    """
+
+    title: Optional[str] = None
+    """Title of the menu item, without the trailing ``>`` of submenus."""
+
+    target: Any = None
+    """Callback of ordinary menu items or the items of submenus."""
+
+    args: Tuple[Any, ...] = ()
+    """Additional positional arguments to forward to the callback."""
+
+
 #: Type of menu item specifications that are accepted by `create_menu_item_from_spec()`
-MenuItemSpecification = Union[None, str, tuple]
+MenuItemSpecification = Union[None, str, tuple, MenuSpec]
 
 T = TypeVar("T")
 
@@ -28,6 +60,15 @@ T = TypeVar("T")
 class Menu(WidgetWrap):
     """urwid widget that represents a menu with a ListBox_."""
 
+    _item_buttons: List["MenuItemButton"]
+    """Buttons in the menu that invoke a callback when clicked."""
+
+    _max_width: int
+    """Width of the widest item in the menu."""
+
+    _submenu_buttons: List["SubmenuButton"]
+    """Buttons in the menu that open a submenu when clicked."""
+
     def __init__(
         self,
         items: Union[
@@ -46,6 +87,18 @@ class Menu(WidgetWrap):
         if callable(items):
             items = items()
         self.items = [create_menu_item_from_spec(item) for item in items]
+        self._max_width = max(
+            (self._get_item_width(item) for item in self.items), default=0
+        )
+
+        self._item_buttons = []
+        self._submenu_buttons = []
+        for item in self.items:
+            item = extract_base_widget(item)
+            if isinstance(item, SubmenuButton):
+                self._submenu_buttons.append(item)
+            elif isinstance(item, MenuItemButton):
+                self._item_buttons.append(item)
         super().__init__(ListBox(SimpleFocusListWalker(self.items)))
 
     def keypress(self, size, key: str):
@@ -55,12 +108,9 @@ class Menu(WidgetWrap):
 
     def pack(self, size, focus: bool = False):
         if not size:
-            # Fixed widget; we get to choose our own size
-            if self.items:
-                max_width = max(self._get_item_width(item) for item in self.items)
-            else:
-                max_width = 0
-            return max_width, self.rows(size, focus)
+            # Fixed widget; we get to choose our own size. The labels of the
+            # items never change so the width is calculated in advance
+            return self._max_width, self.rows(size, focus)
         elif len(size) == 1:
             # Flow widget; we get to choose our own height
             return (size[0], self.rows(size, focus))
@@ -105,6 +155,16 @@ class MenuOverlay(DialogOverlay):
     a cascading dropdown menu (as well as ordinary dialogs).
     """
 
+    _wired_buttons: "WeakSet[Button]"
+    """Buttons whose click signals are already connected to the overlay.
+
+    The default menu factory creates new buttons whenever a menu is opened
+    so this set is never hit for them. It exists for menu factories that
+    cache their menus and return the same buttons again; without it, each
+    opening of such a menu would connect another handler to its buttons
+    since the handlers are not disconnected when the menu is closed.
+    """
+
     def __init__(
         self,
         app_widget,
@@ -121,17 +181,7 @@ class MenuOverlay(DialogOverlay):
         """
         super().__init__(app_widget)
         self._menu_factory = menu_factory
-
-    def _on_menu_closed(self, menu: Widget) -> bool:
-        """Callback to call when a menu widget was closed."""
-        menu = menu.base_widget
-        for item in menu.items:
-            item = extract_base_widget(item)
-            if isinstance(item, SubmenuButton):
-                disconnect_signal(item, "click", self._open_submenu)
-            elif isinstance(item, MenuItemButton):
-                disconnect_signal(item, "click", self._close_all_menus)
-        return True
+        self._wired_buttons = WeakSet()
 
     def open_menu(
         self, items: Sequence[MenuItemSpecification], title: Optional[str] = None
@@ -143,19 +193,25 @@ class MenuOverlay(DialogOverlay):
             title (Optional[str]): optional title of the menu
         """
         menu = self._menu_factory(items)
-
-        for item in menu.items:
-            item = extract_base_widget(item)
-            if isinstance(item, SubmenuButton):
-                connect_signal(item, "click", self._open_submenu)
-            elif isinstance(item, MenuItemButton):
-                connect_signal(item, "click", self._close_all_menus)
+        wired_buttons = self._wired_buttons
+        cls = type(self)
+
+        # Buttons refer to the overlay weakly so they never need to be
+        # disconnected; the handlers go away with either of the two objects
+        for button in menu._submenu_buttons:
+            if button not in wired_buttons:
+                connect_signal(button, "click", cls._open_submenu, weak_args=(self,))
+                wired_buttons.add(button)
+        for button in menu._item_buttons:
+            if button not in wired_buttons:
+                connect_signal(button, "click", cls._close_all_menus, weak_args=(self,))
+                wired_buttons.add(button)
 
         widget = AttrMap(
             PatchedLineBox(menu, title=title), "menu in background", focus_map="menu"
         )
 
-        return self.open_dialog(widget, on_close=self._on_menu_closed, styled=True)
+        return self.open_dialog(widget, styled=True)
 
     def _close_all_menus(self, item: MenuItemButton) -> None:
         self.close()
@@ -224,16 +280,18 @@ def create_submenu_from_enum(
             `create_menu_item_from_spec()`.
     """
     current = getter() if callable(getter) else getter
-    if not title.endswith(">"):
-        title += ">"
+    if title.endswith(">"):
+        title = title[:-1].rstrip()
 
-    return (
+    return MenuSpec(
+        "submenu",
         title,
         [
-            (
+            MenuSpec(
+                "item",
                 "({0}) {1}".format("*" if item is current else " ", item_title),
                 setter,
-                item,
+                (item,),
             )
             for item, item_title in items
         ],
@@ -290,18 +348,47 @@ def create_menu_item_from_spec(spec_: MenuItemSpecification = None):
     when the menu item is selected. Additional elements in the tuple will be
     forwarded to the callback function as positional arguments.
 
+    Parsed `MenuSpec` objects are also accepted and are used as is.
+
     Returns:
         Widget: the constructed menu widget
     """
+    spec = parse_menu_item_spec(spec_)
+    return _menu_item_factories[spec.kind](spec)
+
+
+def parse_menu_item_spec(spec_: MenuItemSpecification = None) -> MenuSpec:
+    """Parses a menu item specification object into a `MenuSpec`.
+
+    See `create_menu_item_from_spec()` for the accepted specification
+    objects.
+
+    Returns:
+        MenuSpec: the parsed specification
+    """
+    if isinstance(spec_, MenuSpec):
+        return spec_
+
     spec = tuplify(spec_)
 
     title = spec[0]
 
     if title is None or title == "-":
-        return create_separator()
+        return _SEPARATOR_SPEC
 
     if title.endswith(">"):
         title = title[:-1].rstrip()
-        return create_submenu(title, spec[1] if len(spec) > 1 else None)
+        return MenuSpec("submenu", title, spec[1] if len(spec) > 1 else None)
+
+    return MenuSpec("item", title, spec[1] if len(spec) > 1 else None, spec[2:])
+
+
+_SEPARATOR_SPEC = MenuSpec("separator")
 
-    return create_menu_item(title, spec[1] if len(spec) > 1 else None, *spec[2:])
+#: Functions that create menu items from parsed specifications, keyed by the
+#: kind of the menu item
+_menu_item_factories: Dict[str, Callable[[MenuSpec], Widget]] = {
+    "item": lambda spec: create_menu_item(spec.title, spec.target, *spec.args),
+    "separator": lambda spec: create_separator(),
+    "submenu": lambda spec: create_submenu(spec.title, spec.target),
+}
@@ -1,13 +1,20 @@
 __all__ = ("ObjectContainerMixin",)
 
-from functools import cmp_to_key
+from bisect import bisect_left
+from itertools import islice
+from operator import itemgetter, lt
 from urwid import emit_signal, Widget
-from typing import Callable, Dict, Generic, Optional, TypeVar
-
-
-def cmp(a, b):
-    """Replacement of `cmp()` from Python 2.x."""
-    return (a > b) - (a < b)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 
 T = TypeVar("T")
@@ -23,12 +30,24 @@ class ObjectContainerMixin(Generic[T]):
     _widgets_by_items: Dict[T, Widget]
     _key_function: Callable[[T], int]
 
+    _keys_by_items: Dict[T, Tuple[Any, int]]
+    """Sort keys of the items in the container, as they were when the items
+    were last sorted.
+    """
+
+    _sorted_keys: List[Tuple[Any, int]]
+    """Sort keys of the items in the container, paired with the IDs of the
+    items, in the same order as the widgets of the items in the container.
+    """
+
     def __init__(self):
         """Constructor."""
         self._key_function = self._default_key_function
 
         self._items_by_widgets = {}
         self._widgets_by_items = {}
+        self._keys_by_items = {}
+        self._sorted_keys = []
 
     def _clear_body(self) -> None:
         if hasattr(self, "body"):
@@ -37,47 +56,6 @@ class ObjectContainerMixin(Generic[T]):
         else:
             self.contents[:] = []  # type: ignore
 
-    def _compare_items(self, first, second) -> int:
-        """Compares two items in order to determine the order in which they
-        should appear in the list.
-
-        Parameters:
-            first: the first item
-            second: the second item
-
-        Returns:
-            0 if the two items are the same or have the same key, negative
-            number if the first item should appear first, positive number
-            if the second item should appear first
-        """
-        key_of_first = self._key_function(first)
-        key_of_second = self._key_function(second)
-        if key_of_first == key_of_second:
-            return 0
-        elif key_of_first > key_of_second:
-            return 1
-        else:
-            return -1
-
-    def _compare_widgets(self, first: Widget, second: Widget) -> int:
-        """Compares two widgets in the list in order to determine the order
-        in which they should appear in the list.
-
-        Parameters:
-            first (urwid.Widget): the first widget
-            second (urwid.Widget): the second widget
-
-        Returns:
-            int: 0 if the two widgets are the same, negative number if the
-                first widget should appear first, positive number if the
-                second widget should appear first
-        """
-        first_item = self._extract_item_from_widget(first)
-        second_item = self._extract_item_from_widget(second)
-        return self._compare_items(first_item, second_item) or cmp(
-            id(first), id(second)
-        )
-
     def _create_and_insert_widget_for_item(self, item: T) -> Widget:
         """Creates a widget that will represent the given item and inserts it
         into the appropriate place in the list.
@@ -98,7 +76,9 @@ class ObjectContainerMixin(Generic[T]):
 
         # Insert the widget into the list so that the list appears sorted by
         # key
-        insertion_index = self._get_insertion_index_for_item(item)
+        self._keys_by_items[item] = sort_key = self._get_sort_key_for_item(item)
+        insertion_index = self._get_insertion_index_for_sort_key(sort_key)
+        self._sorted_keys.insert(insertion_index, sort_key)
         self.add_widget(widget, insertion_index)  # type: ignore
 
         # Return the widget
@@ -121,9 +101,9 @@ class ObjectContainerMixin(Generic[T]):
         """Returns the key to be used shown for an item if the user did not
         override the value in the ``key_function`` property.
         """
-        if hasattr(item, "id"):
+        try:
             return item.id  # type: ignore
-        else:
+        except AttributeError:
             return id(item)
 
     def _emit_item_selected_signal(self) -> None:
@@ -145,7 +125,21 @@ class ObjectContainerMixin(Generic[T]):
         """
         return self._items_by_widgets[widget]
 
-    def _get_insertion_index_for_item(self, item: T) -> Optional[int]:
+    def _get_index_of_item(self, item: T) -> int:
+        """Returns the index of the given item in the list.
+
+        The item is looked up with binary search, using the sort key that
+        was cached for the item when the list was last sorted.
+
+        Parameters:
+            item: the item to look for; it must be in the list
+
+        Returns:
+            the index of the item
+        """
+        return bisect_left(self._sorted_keys, self._keys_by_items[item])
+
+    def _get_insertion_index_for_item(self, item: T) -> int:
         """Given a new item that is not in the list yet, determines the
         insertion point where the item should be inserted in order to keep
         the list sorted.
@@ -154,19 +148,67 @@ class ObjectContainerMixin(Generic[T]):
             item: the item to insert
 
         Returns:
-            the index where the item should be inserted or ``None`` if the item
-            should be inserted at the end
+            the index where the item should be inserted
+
+        Throws:
+            ValueError: if the item is already in the list
+        """
+        return self._get_insertion_index_for_sort_key(self._get_sort_key_for_item(item))
+
+    def _get_insertion_index_for_sort_key(self, sort_key: Tuple[Any, int]) -> int:
+        """Determines the insertion point of an item with the given sort key
+        in order to keep the list sorted, using binary search.
+
+        Parameters:
+            sort_key: the sort key of the item, as returned by
+                ``_get_sort_key_for_item()``
+
+        Returns:
+            the index where the item should be inserted
 
         Throws:
             ValueError: if the item is already in the list
         """
-        for index, existing_widget in enumerate(self.iterwidgets()):  # type: ignore
-            existing_item = self._extract_item_from_widget(existing_widget)
-            if existing_item is item:
-                raise ValueError("item is already in the list")
-            if self._compare_items(existing_item, item) > 0:
-                return index
-        return None
+        sorted_keys = self._sorted_keys
+        index = bisect_left(sorted_keys, sort_key)
+        if index < len(sorted_keys) and sorted_keys[index] == sort_key:
+            raise ValueError("item is already in the list")
+        return index
+
+    def _get_sort_key_for_item(self, item: T) -> Tuple[Any, int]:
+        """Returns the key that determines the position of the given item in
+        the list. Items with the same key are ordered by their IDs.
+        """
+        return self._key_function(item), id(item)
+
+    def _set_sorted_widgets(
+        self, entries: List[Tuple[Tuple[Any, int], Widget]]
+    ) -> None:
+        """Sorts the given list of sort key-widget pairs in place and
+        replaces the contents of the container with the sorted widgets,
+        keeping the focused widget focused.
+
+        Parameters:
+            entries: the sort keys of the items and the corresponding widgets
+        """
+        focused_widget: Optional[Widget] = self.focused_widget  # type: ignore
+
+        entries.sort(key=itemgetter(0))
+
+        sorted_keys = []
+        widgets = []
+        focus_index = -1
+        for index, (sort_key, widget) in enumerate(entries):
+            sorted_keys.append(sort_key)
+            widgets.append(widget)
+            if widget is focused_widget:
+                focus_index = index
+
+        self._sorted_keys = sorted_keys
+        self._bulk_set_body(widgets)  # type: ignore
+
+        if focus_index >= 0:
+            self.focus_position = focus_index
 
     def _prepare_widget(self, widget: Widget) -> None:
         pass
@@ -179,6 +221,8 @@ class ObjectContainerMixin(Generic[T]):
         sorted. The operation will not add another widget for an item if the
         item is already in the list.
 
+        Use ``add_items()`` instead when adding many items at once.
+
         Parameters:
             item: the item that is about to be added.
 
@@ -187,9 +231,53 @@ class ObjectContainerMixin(Generic[T]):
         """
         return self.get_widget_for_item(item, create_if_missing=True)  # type: ignore
 
+    def add_items(self, items: Iterable[T]) -> List[Widget]:
+        """Adds multiple items (or, more precisely, widgets that represent
+        the items) into the list in a single batch.
+
+        The list is re-sorted and re-populated only once at the end, so this
+        takes O((n+m) log (n+m)) time for m new items in a list of n items,
+        while calling ``add_item()`` for each item would take O(m*n) time.
+        Items that are already in the list are ignored.
+
+        Parameters:
+            items: the items to add
+
+        Returns:
+            the widgets that were created for the new items, in the order the
+            items were given
+        """
+        widgets_by_items = self._widgets_by_items
+        items_by_widgets = self._items_by_widgets
+        keys_by_items = self._keys_by_items
+        create_widget = self._create_widget_for_item
+        prepare_widget = self._prepare_widget
+        get_sort_key = self._get_sort_key_for_item
+        new_entries = []
+
+        for item in items:
+            if item in widgets_by_items:
+                continue
+
+            widgets_by_items[item] = widget = create_widget(item)
+            items_by_widgets[widget] = item
+            prepare_widget(widget)
+            keys_by_items[item] = sort_key = get_sort_key(item)
+            new_entries.append((sort_key, widget))
+
+        if new_entries:
+            entries = list(zip(self._sorted_keys, self.iterwidgets()))  # type: ignore
+            entries.extend(new_entries)
+            self._set_sorted_widgets(entries)
+
+        return [widget for _, widget in new_entries]
+
     def clear(self):
         """Removes all the widgets from the list."""
-        self._widgets_by_items = {}
+        self._items_by_widgets.clear()
+        self._widgets_by_items.clear()
+        self._keys_by_items.clear()
+        self._sorted_keys.clear()
         self._clear_body()
 
     def contains_item(self, item):
@@ -202,7 +290,7 @@ class ObjectContainerMixin(Generic[T]):
         Returns:
             bool: whether the list contains a widget for the given item
         """
-        return self.get_widget_for_item(item) is not None
+        return item in self._widgets_by_items
 
     def get_widget_for_item(
         self, item: T, create_if_missing: bool = False
@@ -261,8 +349,9 @@ class ObjectContainerMixin(Generic[T]):
                 it does not exist yet
         """
         widget = self.get_widget_for_item(item, create_if_missing)
-        if widget is not None and hasattr(widget, "refresh"):
-            widget.refresh()
+        refresh = getattr(widget, "refresh", None)
+        if refresh is not None:
+            refresh()
 
     def remove_item(self, item):
         """Removes the widget that represents the given item and returns it.
@@ -275,9 +364,16 @@ class ObjectContainerMixin(Generic[T]):
                 item or ``None`` if there was no widget for the item in the
                 list
         """
-        widget = self.get_widget_for_item(item, create_if_missing=False)
-        self.remove_widget(widget)  # type: ignore
-        del self._widgets_by_items[item]
+        widget = self._widgets_by_items.pop(item, None)
+        if widget is None:
+            return None
+
+        index = self._get_index_of_item(item)
+        self.remove_widget_at(index)  # type: ignore
+        del self._sorted_keys[index]
+
+        del self._keys_by_items[item]
+        del self._items_by_widgets[widget]
         return widget
 
     @property
@@ -295,15 +391,26 @@ class ObjectContainerMixin(Generic[T]):
         """Notifies the widget that the list may have to be re-sorted if the
         sorting function has changed.
         """
-        focused_widget: Optional[Widget] = self.focused_widget  # type: ignore
-
-        widgets = sorted(self.iterwidgets(), key=cmp_to_key(self._compare_widgets))  # type: ignore
-        self._clear_body()
+        # Evaluate the key of each item only once, and sort the widgets by
+        # the keys of their items. The keys may have changed since the last
+        # sort so they are not taken from the cache.
+        keys_by_items = {}
+        decorated = []
+        append = decorated.append
+        extract_item = self._extract_item_from_widget
+        get_sort_key = self._get_sort_key_for_item
+        for widget in self.iterwidgets():  # type: ignore
+            item = extract_item(widget)
+            keys_by_items[item] = sort_key = get_sort_key(item)
+            append((sort_key, widget))
 
-        for widget in widgets:
-            self.add_widget(widget)  # type: ignore
+        self._keys_by_items = keys_by_items
 
-        if focused_widget in widgets:
-            self.focus_position = widgets.index(focused_widget)
+        sorted_keys = [sort_key for sort_key, _ in decorated]
+        if all(map(lt, sorted_keys, islice(sorted_keys, 1, None))):
+            # Order did not change; there is no need to touch the widgets
+            self._sorted_keys = sorted_keys
+        else:
+            self._set_sorted_widgets(decorated)
 
         self.refresh()  # type: ignore
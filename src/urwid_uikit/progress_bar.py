@@ -9,11 +9,31 @@ __all__ = ("CustomTextProgressBar",)
 class CustomTextProgressBar(ProgressBar):
     """Progress bar that allows custom text to be placed on it."""
 
+    __slots__ = ("_has_error", "_has_warning", "_successful", "_template")
+
     _has_error: bool
     _has_warning: bool
     _successful: bool
     _template: str
 
+    _STYLE_BY_FLAGS = {
+        (has_error, has_warning, successful): "progress bar {0}".format(
+            "error"
+            if has_error
+            else "warning"
+            if has_warning
+            else "successful"
+            if successful
+            else "complete"
+        )
+        for has_error in (False, True)
+        for has_warning in (False, True)
+        for successful in (False, True)
+    }
+    """Attribute of the completed part of the progress bar, indexed by the
+    ``has_error``, ``has_warning`` and ``successful`` flags.
+    """
+
     def __init__(self, done: float = 100):
         """Constructor."""
         super().__init__(
@@ -27,9 +47,25 @@ class CustomTextProgressBar(ProgressBar):
         self._has_error = False
         self._has_warning = False
 
+    def set_completion(self, current: float) -> None:
+        """Sets the current progress of the progress bar.
+
+        The progress bar is not invalidated (and hence not re-rendered) if the
+        progress did not change.
+        """
+        if current != self._current:
+            super().set_completion(current)
+
+    current = property(lambda self: self._current, set_completion)
+
     def get_text(self) -> str:
         """Returns the text to be shown on the progress bar."""
-        percent = min(100, max(0, int(self.current * 100 / self.done)))
+        done = self.done
+        percent = int(self.current * 100 / done) if done else 0
+        if percent < 0:
+            percent = 0
+        elif percent > 100:
+            percent = 100
         return self._template.format(percent)
 
     @property
@@ -75,22 +111,16 @@ class CustomTextProgressBar(ProgressBar):
         if value == self._successful:
             return
 
-        self._successful = value
+        self._successful = bool(value)
         self._update_style()
 
     def _update_style(self) -> None:
         """Updates the style of the progress bar after the ``successful``
         or ``has_error`` flags were altered.
         """
-        self.complete = "progress bar {0}".format(
-            "error"
-            if self._has_error
-            else "warning"
-            if self._has_warning
-            else "successful"
-            if self._successful
-            else "complete"
-        )
+        self.complete = self._STYLE_BY_FLAGS[
+            self._has_error, self._has_warning, self._successful
+        ]
         self._invalidate()
 
     @property